@@ -7,13 +7,21 @@ from each URL, then adds these as new columns to the CSV.
 """
 
 import requests
-from bs4 import BeautifulSoup
-import time
-import random
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+import re
 import csv
 import os
 import logging
+import itertools
+import sqlite3
+import multiprocessing
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import closing, nullcontext
+from fas_http_cache import HTTPCache
+from fas_rate_limiter import RateLimiter, RateLimitedRetry
 from urllib.parse import urljoin
 
 # Configure logging
@@ -23,98 +31,182 @@ logging.basicConfig(
 )
 logger = logging.getLogger('FAS_Content_Scraper')
 
+# Large output buffer so long content rows go out in few write() calls
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+def read_table(path):
+    """Read a publications table, using Parquet for .parquet files and CSV otherwise."""
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    # Read every column as text so only empty cells count as missing
+    return pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[''])
+
+def write_table(df, path):
+    """Write a publications table, using Parquet for .parquet files and CSV otherwise."""
+    if path.endswith('.parquet'):
+        df.to_parquet(path, index=False, compression='zstd')
+        return
+    
+    # Stream rows through csv.writer into a temporary file and swap it in, so an
+    # interrupted save never leaves a truncated table behind. Minimal quoting
+    # still quotes any field containing commas, quotes or newlines.
+    part_file = f"{path}.part"
+    with open(part_file, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(df.columns)
+        writer.writerows(
+            ['' if pd.isna(value) else value for value in row]
+            for row in df.itertuples(index=False, name=None)
+        )
+        # Sync once, before the swap, rather than flushing as rows are written
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(part_file, path)
+
+def _parse_content(html):
+    """Parse a publication page and extract its (title, content); picklable for process pools."""
+    return FASContentScraper.extract_content(LexborHTMLParser(html))
+
 class FASContentScraper:
     """Scraper for extracting content from FAS publication pages."""
     
-    def __init__(self, csv_file='fas_publications.csv', min_delay=3, max_delay=6):
+    # Runs of whitespace (newlines, tabs, repeated spaces) collapse to one space
+    _WHITESPACE_RE = re.compile(r'\s+')
+    
+    # Class name fragments marking navigation, metadata, etc. inside the content
+    _SKIP_CLASSES = ('navigation', 'meta', 'author', 'date')
+    
+    # Title recorded for pages without an <h1>
+    _NO_TITLE = "No Title Found"
+    
+    def __init__(self, csv_file='fas_publications.csv', min_delay=3, max_delay=6, workers=4,
+                 output_file=None, cache_file='fas_http_cache.sqlite', parse_workers=0):
         """
         Initialize the content scraper.
         
         Args:
-            csv_file: Path to the CSV file containing publication URLs
-            min_delay: Minimum delay between requests in seconds
-            max_delay: Maximum delay between requests in seconds
+            csv_file: Path to the CSV (or Parquet) file containing publication URLs
+            min_delay: Delay between requests in seconds
+            max_delay: Longest delay between requests after the server pushes back
+            workers: Number of URLs to fetch concurrently
+            output_file: Path to write results to (defaults to csv_file); a
+                .parquet extension stores the table as Parquet
+            cache_file: Path to the HTTP cache database (None disables caching)
+            parse_workers: Number of processes to parse pages in (0 parses in
+                the fetching threads)
         """
         self.csv_file = csv_file
+        self.output_file = output_file or csv_file
+        self.progress_file = f"{os.path.splitext(self.output_file)[0]}.progress.sqlite"
         self.min_delay = min_delay
         self.max_delay = max_delay
+        self.workers = workers
+        self.parse_workers = parse_workers
+        self.cache = HTTPCache(cache_file) if cache_file else None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'FAS Publication Content Parser - Research Tool - Contact example@example.com',
             'Accept': 'text/html,application/xhtml+xml,application/xml',
             'Accept-Language': 'en-US,en;q=0.9',
+            'Connection': 'keep-alive',
         })
         
-    def _random_delay(self):
-        """Implement a random delay between requests to avoid overloading the server."""
-        delay = random.uniform(self.min_delay, self.max_delay)
-        logger.info(f"Waiting for {delay:.2f} seconds...")
-        time.sleep(delay)
-    
-    def fetch_page(self, url):
+        # Request pacing shared by all worker threads
+        self.rate_limiter = RateLimiter(min_delay, max_delay)
+        
+        # Keep connections to the server alive between requests and retry
+        # transient failures with exponential backoff; one pooled connection
+        # per worker thread is enough, since every request goes to fas.org
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(workers, 1),
+            max_retries=RateLimitedRetry(
+                total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                rate_limiter=self.rate_limiter
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+    def _fetch_html(self, url):
         """
-        Fetch a page with proper error handling and rate limiting.
+        Fetch the HTML of a page with proper error handling and rate limiting.
         
         Args:
             url: The URL to fetch
             
         Returns:
-            BeautifulSoup object of the page or None if fetch failed
+            The page's raw HTML bytes or None if fetch failed
         """
         logger.info(f"Fetching: {url}")
         try:
-            self._random_delay()
+            if self.cache:
+                # Cache hits skip the delay since they don't touch the server
+                return self.cache.fetch(self.session, url, before_request=self.rate_limiter.wait)
+            self.rate_limiter.wait()
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            # Hand the raw bytes to the parser rather than having requests guess a charset
+            return response.content
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
     
-    def extract_content(self, soup):
+    def fetch_page(self, url):
+        """
+        Fetch a page with proper error handling and rate limiting.
+        
+        Args:
+            url: The URL to fetch
+            
+        Returns:
+            Parsed HTML tree of the page or None if fetch failed
+        """
+        html = self._fetch_html(url)
+        return LexborHTMLParser(html) if html is not None else None
+    
+    @classmethod
+    def extract_content(cls, tree):
         """
         Extract title and content from a publication page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed HTML tree of the page
             
         Returns:
             Tuple of (title, content) or (None, None) if extraction failed
         """
-        if not soup:
+        if tree is None:
             return None, None
         
         try:
             # Extract title - adjust selectors based on the actual page structure
-            title_element = soup.find('h1')
-            title = title_element.get_text().strip() if title_element else "No Title Found"
+            title_element = tree.css_first('h1')
+            title = title_element.text().strip() if title_element else cls._NO_TITLE
             
             # Clean the title - remove newlines, multiple spaces, etc.
-            title = ' '.join(title.split())
+            title = cls._WHITESPACE_RE.sub(' ', title).strip()
             
             # Extract content - adjust selectors based on the actual page structure
             # Looking for the main content area which might be in a div with a specific class
-            content_element = soup.find('article') or soup.find('div', class_='content') or soup.find('div', class_='post-content')
+            candidates = tree.css('article, div.content, div.post-content')
+            content_element = min(candidates, key=cls._content_rank, default=None)
             
             if content_element:
-                # Get all paragraphs and headings within the content
-                content_parts = []
-                for element in content_element.find_all(['p', 'h2', 'h3', 'h4', 'ul', 'ol']):
-                    # Skip elements that appear to be navigation, metadata, etc.
-                    if not any(cls in str(element.get('class', [])) for cls in ['navigation', 'meta', 'author', 'date']):
-                        content_parts.append(element.get_text().strip())
-                
-                content = " ".join(content_parts)
+                # Get all paragraphs and headings within the content, skipping
+                # elements that appear to be navigation, metadata, etc.
+                content = " ".join(
+                    element.text().strip()
+                    for element in content_element.css('p, h2, h3, h4, ul, ol')
+                    if not any(skip in (element.attributes.get('class') or '') for skip in cls._SKIP_CLASSES)
+                )
             else:
                 # Fallback: get all paragraphs on the page
-                paragraphs = soup.find_all('p')
-                content = " ".join(p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 50)
+                paragraphs = (p.text().strip() for p in tree.css('p'))
+                content = " ".join(text for text in paragraphs if len(text) > 50)
             
-            # Clean up content - replace newlines, tabs, etc with spaces
-            content = content.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-            # Remove multiple spaces
-            while '  ' in content:
-                content = content.replace('  ', ' ')
+            # Clean up content - replace newlines, tabs and multiple spaces with single spaces
+            content = cls._WHITESPACE_RE.sub(' ', content).strip()
                 
             return title, content
         
@@ -122,109 +214,269 @@ class FASContentScraper:
             logger.error(f"Error extracting content: {e}")
             return None, None
     
-    def process_publications(self, start_index=0, limit=None):
+    @staticmethod
+    def _content_rank(node):
+        """Rank a content container candidate: article first, then div.content, then div.post-content."""
+        if node.tag == 'article':
+            return 0
+        return 1 if 'content' in (node.attributes.get('class') or '').split() else 2
+    
+    def _fetch_and_extract(self, url, parse_pool=None):
+        """
+        Fetch a publication page and extract its title and content.
+        
+        Args:
+            url: The URL to process
+            parse_pool: Optional process pool to parse the page in
+            
+        Returns:
+            Tuple of (title, content) or (None, None) if processing failed
+        """
+        try:
+            html = self._fetch_html(url)
+            if html is None:
+                return None, None
+            if parse_pool:
+                return parse_pool.submit(_parse_content, html).result()
+            return _parse_content(html)
+        except Exception as e:
+            logger.error(f"Error processing URL {url}: {e}")
+            return None, None
+    
+    def _load_results(self, df, results, source):
+        """
+        Fold results saved by an earlier or interrupted run back into the DataFrame.
+        
+        Args:
+            df: DataFrame of publications to update in place
+            results: DataFrame with URL, Title and Content columns to take results from
+            source: Where the results came from, for logging
+        """
+        results = results.dropna(subset=['Title', 'Content'])
+        if results.empty:
+            return
+        
+        results = results.drop_duplicates('URL', keep='last').set_index('URL')
+        pending = (df['Title'].isna() | df['Content'].isna()) & df['URL'].isin(results.index)
+        df.loc[pending, 'Title'] = df.loc[pending, 'URL'].map(results['Title'])
+        df.loc[pending, 'Content'] = df.loc[pending, 'URL'].map(results['Content'])
+        logger.info(f"Recovered {pending.sum()} results from {source}")
+    
+    def _open_progress(self):
+        """
+        Open the progress database, creating it if needed.
+        
+        Returns:
+            sqlite3 connection with a results(url, title, content) table
+        """
+        conn = sqlite3.connect(self.progress_file)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('CREATE TABLE IF NOT EXISTS results (url TEXT PRIMARY KEY, title TEXT, content TEXT)')
+        return conn
+    
+    def _save_results(self, progress, df, results):
+        """
+        Save a batch of results to the progress database and the DataFrame.
+        
+        Args:
+            progress: Connection to the progress database
+            df: DataFrame of publications to update in place
+            results: List of (index, url, title, content) tuples
+        """
+        indices, urls, titles, contents = zip(*results)
+        
+        # Save the batch in a single transaction
+        with progress:
+            progress.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?)', zip(urls, titles, contents))
+        logger.info(f"Saved progress to {self.progress_file}")
+        
+        # Update the DataFrame once per batch
+        df.loc[list(indices), 'Title'] = list(titles)
+        df.loc[list(indices), 'Content'] = list(contents)
+    
+    def load_publications(self):
+        """
+        Read the input file, merging in results from an existing output file.
+        
+        Returns:
+            DataFrame of publications with Title and Content columns
+        """
+        # Read the input file into a pandas DataFrame
+        df = read_table(self.csv_file)
+        
+        # Check if the required columns exist
+        if 'Title' not in df.columns:
+            df['Title'] = None
+        if 'Content' not in df.columns:
+            df['Content'] = None
+        
+        # Resume from an existing output file
+        if self.output_file != self.csv_file and os.path.exists(self.output_file):
+            self._load_results(df, read_table(self.output_file), self.output_file)
+        
+        return df
+    
+    def process_publications(self, start_index=0, limit=None, df=None):
         """
-        Process all publications in the CSV file and add title and content.
+        Process all publications in the input file and add title and content.
         
         Args:
             start_index: Index to start processing from (useful for resuming)
             limit: Maximum number of URLs to process (useful for testing)
+            df: Publications already returned by load_publications, updated in place
+                (read from the input file if not given)
         """
         try:
-            # Read the CSV file into a pandas DataFrame
-            df = pd.read_csv(self.csv_file)
-            
-            # Check if the required columns exist
-            if 'Title' not in df.columns:
-                df['Title'] = None
-            if 'Content' not in df.columns:
-                df['Content'] = None
-            
-            # Calculate end index based on limit if provided
-            end_index = min(start_index + limit, len(df)) if limit else len(df)
-            logger.info(f"Processing URLs from index {start_index} to {end_index-1} (total: {end_index-start_index})")
+            if df is None:
+                df = self.load_publications()
             
-            # Process each row
-            for index in range(start_index, end_index):
-                row = df.iloc[index]
-                url = row['URL']
+            # Results are committed to the progress database as they arrive, so
+            # an interruption only loses the chunk in flight
+            with closing(self._open_progress()) as progress:
+                # Resume from an interrupted run
+                saved = pd.read_sql_query('SELECT url AS URL, title AS Title, content AS Content FROM results', progress)
+                self._load_results(df, saved, self.progress_file)
                 
-                # Skip already processed URLs
-                if pd.notna(row['Title']) and pd.notna(row['Content']):
-                    logger.info(f"Skipping already processed URL [{index+1}/{end_index}]: {url}")
-                    continue
+                # Calculate end index based on limit if provided
+                end_index = min(start_index + limit, len(df)) if limit else len(df)
+                logger.info(f"Processing URLs from index {start_index} to {end_index-1} (total: {end_index-start_index})")
                 
-                try:
-                    # Fetch and extract content
-                    soup = self.fetch_page(url)
-                    title, content = self.extract_content(soup)
-                    
-                    # Update the DataFrame
-                    if title and content:
-                        df.at[index, 'Title'] = title
-                        df.at[index, 'Content'] = content
-                        logger.info(f"Successfully processed URL [{index+1}/{end_index}]: {url}")
-                    else:
-                        logger.warning(f"Failed to extract content from URL [{index+1}/{end_index}]: {url}")
-                        
-                    # Save after each successful extraction or every 5 publications
-                    if index % 5 == 0 or index == end_index - 1:
-                        # Save with proper CSV handling to avoid issues with newlines
-                        df.to_csv(self.csv_file, index=False, quoting=csv.QUOTE_ALL, escapechar='\\')
-                        logger.info(f"Saved progress to {self.csv_file}")
-                        
-                except Exception as e:
-                    logger.error(f"Error processing URL {url}: {e}")
-                    # Continue with next URL instead of failing the entire process
-                    continue
+                # Pull the columns out of the DataFrame once rather than per row
+                all_urls = df['URL'].to_numpy()
+                listing_titles = df['Title'].to_numpy()
+                done = (df['Title'].notna() & df['Content'].notna()).to_numpy()
+                
+                # Collect the rows that still need processing, skipping already processed URLs
+                todo = (np.flatnonzero(~done[start_index:end_index]) + start_index).tolist()
+                skipped = end_index - start_index - len(todo)
+                if skipped:
+                    logger.info(f"Skipping {skipped} already processed URLs")
+                
+                # Fetch each URL once; URL lists written before the URL scraper
+                # dropped duplicates can list a publication on several rows
+                rows_by_url = {}
+                for index in todo:
+                    rows_by_url.setdefault(all_urls[index], []).append(index)
+                if len(rows_by_url) < len(todo):
+                    logger.info(f"Fetching {len(rows_by_url)} unique URLs for {len(todo)} rows")
+                todo = [rows[0] for rows in rows_by_url.values()]
+                
+                # Worker threads fetch and parse pages while this thread is the
+                # single writer: it collects results as they complete, keeps a
+                # bounded number of URLs in flight and saves in batches
+                queue = iter(todo)
+                results = []
+                
+                # Parsing is CPU-bound, so it can be moved into separate processes
+                # to scale with cores; spawn avoids forking a multithreaded process
+                parse_pool = None
+                if self.parse_workers:
+                    parse_pool = ProcessPoolExecutor(self.parse_workers, mp_context=multiprocessing.get_context('spawn'))
+                
+                with parse_pool or nullcontext(), ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    in_flight = {
+                        executor.submit(self._fetch_and_extract, all_urls[index], parse_pool): index
+                        for index in itertools.islice(queue, self.workers * 2)
+                    }
+                    try:
+                        while in_flight:
+                            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                            for future in finished:
+                                index = in_flight.pop(future)
+                                url = all_urls[index]
+                                title, content = future.result()
+                                # Fall back to the title the URL scraper found in the archive listing
+                                if title == self._NO_TITLE and pd.notna(listing_titles[index]):
+                                    title = listing_titles[index]
+                                if title and content:
+                                    results.extend((row, url, title, content) for row in rows_by_url[url])
+                                    logger.info(f"Successfully processed URL [{index+1}/{end_index}]: {url}")
+                                else:
+                                    logger.warning(f"Failed to extract content from URL [{index+1}/{end_index}]: {url}")
+                                
+                                for next_index in itertools.islice(queue, 1):
+                                    in_flight[executor.submit(self._fetch_and_extract, all_urls[next_index], parse_pool)] = next_index
+                            
+                            if len(results) >= self.workers * 4 or (results and not in_flight):
+                                self._save_results(progress, df, results)
+                                results = []
+                    finally:
+                        # Don't fetch URLs queued behind an interrupt or error
+                        for future in in_flight:
+                            future.cancel()
             
             # Final save
-            df.to_csv(self.csv_file, index=False, quoting=csv.QUOTE_ALL, escapechar='\\')
+            write_table(df, self.output_file)
+            os.remove(self.progress_file)
             logger.info(f"Completed processing {end_index - start_index} URLs")
             
         except Exception as e:
             logger.error(f"Error processing publications: {e}")
+    
+    def close(self):
+        """Close the HTTP cache."""
+        if self.cache:
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Extract content from FAS publication URLs')
     parser.add_argument('--input', type=str, default='fas_publications.csv',
-                        help='Input CSV file with URLs')
+                        help='Input CSV (or .parquet) file with URLs')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Output file for results (default: the input file); '
+                             'use a .parquet extension to store results as Parquet')
     parser.add_argument('--min-delay', type=float, default=3.0,
-                        help='Minimum delay between requests in seconds')
+                        help='Delay between requests in seconds')
     parser.add_argument('--max-delay', type=float, default=6.0,
-                        help='Maximum delay between requests in seconds')
+                        help='Maximum delay between requests when the server asks to slow down')
     parser.add_argument('--start', type=int, default=0,
                         help='Start processing from this index (for resuming)')
     parser.add_argument('--limit', type=int, default=None,
                         help='Limit processing to this many URLs (for testing)')
     parser.add_argument('--batch', type=int, default=None,
                         help='Process URLs in batches of this size')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Number of URLs to fetch concurrently')
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help='Number of processes to parse pages in (default: 0, parse in the fetching threads)')
+    parser.add_argument('--cache', type=str, default='fas_http_cache.sqlite',
+                        help='HTTP cache database used to avoid re-downloading unchanged pages')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always download pages instead of using the HTTP cache')
     args = parser.parse_args()
     
     # Create the content scraper
-    scraper = FASContentScraper(
+    with FASContentScraper(
         csv_file=args.input,
         min_delay=args.min_delay, 
-        max_delay=args.max_delay
-    )
-    
-    # Process the publications
-    if args.batch:
-        # Read the CSV to determine total records
-        df = pd.read_csv(args.input)
-        total = len(df)
-        
-        start_index = args.start
-        while start_index < total:
-            end_index = min(start_index + args.batch, total)
-            logger.info(f"Processing batch from {start_index} to {end_index-1} (batch size: {args.batch})")
-            scraper.process_publications(start_index=start_index, limit=args.batch)
-            start_index += args.batch
-    else:
-        # Process publications normally
-        scraper.process_publications(start_index=args.start, limit=args.limit)
+        max_delay=args.max_delay,
+        workers=args.workers,
+        output_file=args.output,
+        cache_file=None if args.no_cache else args.cache,
+        parse_workers=args.parse_workers
+    ) as scraper:
+        # Process the publications
+        if args.batch:
+            # Read the input once and share it between batches
+            df = scraper.load_publications()
+            total = len(df)
+            
+            for start_index in range(args.start, total, args.batch):
+                end_index = min(start_index + args.batch, total)
+                logger.info(f"Processing batch from {start_index} to {end_index-1} (batch size: {args.batch})")
+                scraper.process_publications(start_index=start_index, limit=args.batch, df=df)
+        else:
+            # Process publications normally
+            scraper.process_publications(start_index=args.start, limit=args.limit)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""
+FAS HTTP Cache
+
+This module stores fetched pages together with their ETag/Last-Modified validators
+in a SQLite database, so repeat runs of the scrapers can skip recently fetched pages
+entirely and revalidate older ones with conditional GETs instead of downloading them again.
+Data extracted from a page can be stored alongside it, so unchanged pages don't need
+to be parsed again either.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import logging
+
+logger = logging.getLogger('FAS_HTTP_Cache')
+
+
+class HTTPCache:
+    """A SQLite-backed cache of page bodies keyed by URL."""
+
+    def __init__(self, path='fas_http_cache.sqlite', max_age=86400):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite cache file
+            max_age: Seconds a cached page is served without contacting the server
+        """
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+            'body BLOB, fetched_at REAL)'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS extracted (url TEXT PRIMARY KEY, digest TEXT, data TEXT)'
+        )
+
+    def _get(self, url):
+        """Return the cached (etag, last_modified, body, fetched_at) row for a URL, if any."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT etag, last_modified, body, fetched_at FROM responses WHERE url = ?',
+                (url,)
+            ).fetchone()
+
+    def _store(self, url, response):
+        """Save a successful response and its validators."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+                (url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 response.content, time.time())
+            )
+
+    def _touch(self, url):
+        """Mark a cached page as freshly validated."""
+        with self._lock:
+            self._conn.execute('UPDATE responses SET fetched_at = ? WHERE url = ?', (time.time(), url))
+
+    def fetch(self, session, url, before_request=None, timeout=30):
+        """
+        Fetch a page through the cache.
+
+        Fresh pages are returned without any request. Stale pages are revalidated
+        with If-None-Match/If-Modified-Since, and a 304 response reuses the cached body.
+
+        Args:
+            session: requests.Session used for network requests
+            url: The URL to fetch
+            before_request: Optional callable run before each network request (e.g. a delay)
+            timeout: Request timeout in seconds
+
+        Returns:
+            The raw page body as bytes
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        cached = self._get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, body, fetched_at = cached
+            if time.time() - fetched_at < self.max_age:
+                logger.info(f"Using cached copy of {url}")
+                return body
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        if before_request:
+            before_request()
+        response = session.get(url, timeout=timeout, headers=headers)
+
+        if response.status_code == 304 and cached:
+            logger.info(f"Not modified since last fetch: {url}")
+            self._touch(url)
+            return body
+
+        response.raise_for_status()
+        self._store(url, response)
+        return response.content
+
+    @staticmethod
+    def _digest(body, version):
+        """Fingerprint a page body together with the version of the extractor."""
+        return hashlib.blake2b(body, digest_size=16, salt=str(version).encode()).hexdigest()
+
+    def get_extracted(self, url, body, version=0):
+        """
+        Look up data previously extracted from a page.
+
+        Args:
+            url: The page URL
+            body: The page body as returned by fetch
+            version: Version of the extractor whose data is wanted
+
+        Returns:
+            The stored data, or None if nothing was stored for this exact body and version
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT digest, data FROM extracted WHERE url = ?', (url,)).fetchone()
+        if row and row[0] == self._digest(body, version):
+            return json.loads(row[1])
+        return None
+
+    def store_extracted(self, url, body, data, version=0):
+        """
+        Save data extracted from a page, tied to the body it came from.
+
+        Args:
+            url: The page URL
+            body: The page body the data was extracted from
+            data: JSON-serializable data to store
+            version: Version of the extractor the data came from
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO extracted VALUES (?, ?, ?)',
+                (url, self._digest(body, version), json.dumps(data))
+            )
+
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,114 @@
+"""
+FAS Rate Limiter
+
+This module paces requests to fas.org. A single limiter is shared by all of a
+scraper's worker threads, so the request rate is capped for the scraper as a whole
+rather than per worker. When the server pushes back with a 429 or 503 response, the
+limiter pauses every worker for the requested Retry-After time and widens the
+spacing between requests, relaxing it again as requests go through.
+"""
+
+import threading
+import time
+import logging
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger('FAS_Rate_Limiter')
+
+# Status codes with which the server asks clients to slow down
+BACKOFF_STATUSES = (429, 503)
+
+
+class RateLimiter:
+    """A thread-safe token bucket holding one token, refilled at an adaptive interval."""
+
+    def __init__(self, min_delay, max_delay):
+        """
+        Set up the limiter.
+
+        Args:
+            min_delay: Delay between requests in seconds while the server keeps up
+            max_delay: Longest delay between requests after the server pushes back
+        """
+        self.min_delay = min_delay
+        self.max_delay = max(max_delay, min_delay)
+        self.interval = min_delay
+        self._lock = threading.Lock()
+        self._next_token_time = 0.0
+        self._resume_time = 0.0
+
+    def wait(self):
+        """
+        Block until a request may be sent.
+
+        Each caller reserves the next token under the lock and then sleeps outside
+        it, so waiting threads queue up for successive slots instead of all firing
+        together when a token becomes available. A caller whose slot falls inside
+        a pause requested by back_off while it slept reserves a new slot after it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                slot = max(now, self._next_token_time, self._resume_time)
+                self._next_token_time = slot + self.interval
+                # Ease back towards the normal spacing after a slowdown
+                self.interval = max(self.min_delay, self.interval * 0.9)
+            delay = slot - now
+            if delay > 0:
+                logger.info(f"Waiting for {delay:.2f} seconds...")
+                time.sleep(delay)
+            with self._lock:
+                if self._resume_time <= slot:
+                    return
+
+    def back_off(self, retry_after=None):
+        """
+        Slow down after the server asked for it.
+
+        Args:
+            retry_after: Seconds the server asked to wait (None to wait one interval)
+        """
+        with self._lock:
+            self.interval = min(self.max_delay, max(self.interval * 2, self.min_delay))
+            pause = retry_after if retry_after is not None else self.interval
+            self._resume_time = max(self._resume_time, time.monotonic() + pause)
+            self._next_token_time = max(self._next_token_time, self._resume_time)
+        logger.warning(f"Server asked to slow down, pausing requests for {pause:.2f} seconds")
+
+
+class RateLimitedRetry(Retry):
+    """A urllib3 retry policy that reports server pushback to a RateLimiter."""
+
+    def __init__(self, *args, rate_limiter=None, **kwargs):
+        """
+        Set up the retry policy.
+
+        Args:
+            rate_limiter: RateLimiter to slow down on 429/503 responses
+            *args, **kwargs: Passed on to urllib3's Retry
+        """
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+
+    def new(self, **kwargs):
+        """Copy the policy for the next attempt, keeping the rate limiter."""
+        kwargs.setdefault('rate_limiter', self.rate_limiter)
+        return super().new(**kwargs)
+
+    def sleep(self, response=None):
+        """
+        Wait before a retry, sending the retry through a rate limiter slot.
+
+        On 429/503 responses all workers are paused via the rate limiter instead
+        of only this thread sleeping; other failures keep urllib3's exponential
+        backoff before the retry waits for its slot.
+        """
+        if not self.rate_limiter:
+            super().sleep(response)
+            return
+        if response is not None and response.status in BACKOFF_STATUSES:
+            retry_after = self.get_retry_after(response) if self.respect_retry_after_header else None
+            self.rate_limiter.back_off(retry_after)
+        else:
+            super().sleep(response)
+        self.rate_limiter.wait()
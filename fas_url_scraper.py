@@ -8,42 +8,122 @@ It includes proper rate limiting to avoid overloading the FAS website server.
 """
 
 import requests
-from bs4 import BeautifulSoup
-import time
-import random
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 import re
 import argparse
+from html import unescape
 from urllib.parse import urljoin
 import logging
 import csv
 import os
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fas_http_cache import HTTPCache
+from fas_rate_limiter import RateLimiter, RateLimitedRetry
+
+# Publication pages live directly under /publication/ (singular); the archive and
+# index pages under /publications/, and feed, comment or share links below a
+# publication, never match
+_PUBLICATION_PREFIX = 'https://fas.org/publication/'
+
+# Archive pages are scanned as raw bytes rather than parsed, since only the
+# links, their heading titles and the page headings are needed. Attribute values
+# may be double-quoted, single-quoted or unquoted, as an HTML parser accepts, and
+# quoted values may contain '>'. Comments, scripts and styles hold no elements for
+# a parser, so they are removed before scanning
+_INERT_RE = re.compile(rb'<!--.*?(?:-->|\Z)|<(script|style)\b.*?(?:</\1\s*>|\Z)', re.S | re.I)
+_ATTRS = rb'''(?:"[^"]*"|'[^']*'|[^>"'])*'''
+_HREF_VALUE = rb'''href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))'''
+_LINK_RE = re.compile(rb'<a\s(?:' + _ATTRS + rb'?\s)?' + _HREF_VALUE, re.I)
+_LINK_TEXT_RE = re.compile(
+    rb'<a\s(?:' + _ATTRS + rb'?\s)?' + _HREF_VALUE + _ATTRS + rb'>(.*?)</a\s*>', re.S | re.I
+)
+_LINK_HEADING_RE = re.compile(rb'<h([23])\b' + _ATTRS + rb'>(.*?)</h\1\s*>', re.S | re.I)
+_HEADING_RE = re.compile(rb'<h([12])\b' + _ATTRS + rb'>(.*?)</h\1\s*>', re.S | re.I)
+_TAG_RE = re.compile(rb'<[^>]+>')
+
+# Version of the page extraction stored in the HTTP cache. Bump it whenever
+# extract_publications_from_page, extract_titles_from_page or
+# _has_publication_headings change, so pages extracted by older code are scanned again
+_EXTRACTOR_VERSION = 3
+
+# Pagination selectors and patterns, compiled once rather than per element. The
+# selectors are matched by Lexbor in C, so only candidate elements reach Python
+_PAGINATION_SELECTOR = (
+    ':is(div, nav, ul):is([class*="pagination" i], [class*="pager" i], '
+    '[class*="nav" i], [class*="page-numbers" i])'
+)
+_NEXT_LINK_SELECTOR = (
+    'link[rel="next"][href]:not([href=""]), a[rel~="next"][href]:not([href=""]), '
+    'a.next[href]:not([href=""])'
+)
+_NEXT_TEXT_RE = re.compile(r'next|more|»|>|→', re.I)
+_PAGE_HREF_RE = re.compile(r'/page/(\d+)|[?&](?:p|page|paged)=(\d+)')
+
+
+def _is_publication_url(url):
+    """Check whether a URL is a publication page, using plain string operations."""
+    if not url.startswith(_PUBLICATION_PREFIX):
+        return False
+    slug = url[len(_PUBLICATION_PREFIX):]
+    if slug.endswith('/'):
+        slug = slug[:-1]
+    return bool(slug) and '/' not in slug and '?' not in slug and '#' not in slug
 
 
 class FASPublicationScraper:
     """A scraper for FAS publications with rate limiting and pagination handling."""
     
     def __init__(self, base_url="https://fas.org/publications-archive/", 
-                 min_delay=2, max_delay=5, output_file='fas_publications.csv'):
+                 min_delay=2, max_delay=5, output_file='fas_publications.csv',
+                 cache_file='fas_http_cache.sqlite', workers=4, probe_pagination=False):
         """
         Initialize the scraper with configurable rate limiting.
         
         Args:
             base_url: The base URL for the FAS publications archive
-            min_delay: Minimum delay between requests in seconds
-            max_delay: Maximum delay between requests in seconds
+            min_delay: Delay between requests in seconds
+            max_delay: Longest delay between requests after the server pushes back
             output_file: Path to the CSV output file
+            cache_file: Path to the HTTP cache database (None disables caching)
+            workers: Number of archive pages to fetch concurrently
+            probe_pagination: Look for pagination links on the first page instead of
+                assuming the archive's /page/N/ URLs
         """
         self.base_url = base_url
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.output_file = output_file
+        self.workers = workers
+        self.probe_pagination = probe_pagination
+        self.cache = HTTPCache(cache_file) if cache_file else None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'FAS Publication Parser - Research Tool - Contact example@example.com',
             'Accept': 'text/html,application/xhtml+xml,application/xml',
             'Accept-Language': 'en-US,en;q=0.9',
+            'Connection': 'keep-alive',
         })
         
+        # Request pacing shared by all worker threads
+        self.rate_limiter = RateLimiter(min_delay, max_delay)
+        
+        # Keep connections to the server alive between requests and retry
+        # transient failures with exponential backoff; one pooled connection
+        # per worker thread is enough, since every request goes to fas.org
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(workers, 1),
+            max_retries=RateLimitedRetry(
+                total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                rate_limiter=self.rate_limiter
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Configure logging
         logging.basicConfig(
             level=logging.INFO,
@@ -51,19 +131,24 @@ class FASPublicationScraper:
         )
         self.logger = logging.getLogger('FAS_Scraper')
         
-        # Storage for all publication URLs
+        # Storage for all publication URLs and the titles shown for them in the archive
         self.publication_urls = []
+        self.publication_titles = {}
+        
+        # URLs already recorded, so publications listed on several pages are kept once
+        self._seen = set()
         
         # Initialize CSV file with headers
         self._initialize_csv()
     
     def _initialize_csv(self):
-        """Initialize the CSV file with headers if it doesn't exist."""
+        """Initialize the CSV file with headers and keep it open for appending."""
         # Always start with a fresh file to ensure headers are included
-        with open(self.output_file, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['URL', 'Page'])
-            self.logger.info(f"Initialized CSV file: {self.output_file}")
+        self._csv_file = open(self.output_file, 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(['URL', 'Page', 'Title'])
+        self._csv_file.flush()
+        self.logger.info(f"Initialized CSV file: {self.output_file}")
     
     def _append_to_csv(self, urls, page_num):
         """
@@ -73,10 +158,10 @@ class FASPublicationScraper:
             urls: List of URLs to append
             page_num: The page number these URLs were found on
         """
-        with open(self.output_file, 'a', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            for url in urls:
-                writer.writerow([url, page_num])
+        self._csv_writer.writerows((url, page_num, self.publication_titles.get(url, '')) for url in urls)
+        
+        # Flush so the CSV on disk is complete up to this page
+        self._csv_file.flush()
                 
         # Create progress message with max_pages if available
         max_page_str = ""
@@ -85,122 +170,198 @@ class FASPublicationScraper:
             
         self.logger.info(f"Added {len(urls)} URLs from page {page_num}{max_page_str} to {self.output_file}")
     
-    def _random_delay(self):
-        """Implement a random delay between requests to avoid overloading the server."""
-        delay = random.uniform(self.min_delay, self.max_delay)
-        self.logger.info(f"Waiting for {delay:.2f} seconds...")
-        time.sleep(delay)
-    
-    def fetch_page(self, url):
+    def _fetch_html(self, url):
         """
-        Fetch a page with proper error handling and rate limiting.
+        Fetch the HTML of a page with proper error handling and rate limiting.
         
         Args:
             url: The URL to fetch
             
         Returns:
-            BeautifulSoup object of the page or None if fetch failed
+            The page's raw HTML bytes or None if fetch failed
         """
         self.logger.info(f"Fetching: {url}")
         try:
-            self._random_delay()
+            if self.cache:
+                # Cache hits skip the delay since they don't touch the server
+                return self.cache.fetch(self.session, url, before_request=self.rate_limiter.wait)
+            self.rate_limiter.wait()
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            # Hand the raw bytes to the parser rather than having requests guess a charset
+            return response.content
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error fetching {url}: {e}")
             return None
     
-    def extract_publications_from_page(self, soup):
+    def fetch_page(self, url):
+        """
+        Fetch a page with proper error handling and rate limiting.
+        
+        Args:
+            url: The URL to fetch
+            
+        Returns:
+            Parsed HTML tree of the page or None if fetch failed
+        """
+        html = self._fetch_html(url)
+        return LexborHTMLParser(html) if html is not None else None
+    
+    def _scrape_page(self, url):
+        """
+        Fetch an archive page and extract what the scraper needs from it.
+        
+        Pages whose body is unchanged since they were last scraped (such as fresh or
+        not-modified cache hits) reuse the stored extraction instead of being parsed again.
+        
+        Args:
+            url: The URL of the archive page
+            
+        Returns:
+            Dictionary with the page's publication URLs, their listing titles, whether the
+            page has publication headings and, when probing pagination, the next page URL;
+            None if the fetch failed
+        """
+        html = self._fetch_html(url)
+        if html is None:
+            return None
+        
+        # Pagination probing looks for the next link in the page itself, so those
+        # pages are always scanned again
+        reuse = self.cache and not self.probe_pagination
+        if reuse:
+            page = self.cache.get_extracted(url, html, version=_EXTRACTOR_VERSION)
+            if page is not None:
+                self.logger.info(f"Page unchanged, reusing {len(page['publications'])} publication URLs")
+                return page
+        
+        # Everything but pagination probing works on the raw bytes, so the page is
+        # only parsed into a tree when probing
+        page = {
+            'publications': self.extract_publications_from_page(html),
+            'titles': self.extract_titles_from_page(html),
+            # Look for indicators like titles, section headings, etc.
+            'has_headings': self._has_publication_headings(html),
+            'next_url': self.find_next_page_link(LexborHTMLParser(html)) if self.probe_pagination else None,
+        }
+        if reuse:
+            self.cache.store_extracted(url, html, page, version=_EXTRACTOR_VERSION)
+        return page
+    
+    def extract_publications_from_page(self, html):
         """
         Extract publication URLs from a page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            html: Raw HTML bytes of the page
             
         Returns:
             List of publication URLs found on the page
         """
-        urls = []
+        urls = {}
         
-        if not soup:
-            return urls
+        if html is None:
+            return []
             
         # Based on the observed structure of the FAS publications archive page
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            full_url = href if href.startswith('http') else urljoin(self.base_url, href)
-            
-            # Pattern to ignore
-            excluded_patterns = [
-                'https://fas.org/publications/',
-                'https://fas.org/publications-archive/'
-            ]
+        for match in _LINK_RE.finditer(_INERT_RE.sub(b'', html)):
+            full_url = self._link_url(match)
+            if not _is_publication_url(full_url):
+                continue
             
-            # Check if the URL contains /publication/ (singular) and doesn't match any excluded patterns
-            if 'https://fas.org/publication/' in full_url:
-                # Make sure it's not a match for any excluded patterns
-                if not any(full_url.startswith(pattern) for pattern in excluded_patterns):
-                    if full_url not in urls:
-                        urls.append(full_url)
+            # Keep each publication URL once, in page order
+            urls[full_url] = None
         
         self.logger.info(f"Found {len(urls)} publication URLs on page")
-        return urls
+        return list(urls)
     
-    def find_next_page_link(self, soup):
+    def extract_titles_from_page(self, html):
+        """
+        Extract publication titles from the headings of an archive page.
+        
+        Args:
+            html: Raw HTML bytes of the page
+            
+        Returns:
+            Dictionary mapping publication URLs to their titles
+        """
+        titles = {}
+        
+        if html is None:
+            return titles
+        
+        # Archive entries link their title heading to the publication
+        for heading in _LINK_HEADING_RE.finditer(_INERT_RE.sub(b'', html)):
+            for match in _LINK_TEXT_RE.finditer(heading.group(2)):
+                full_url = self._link_url(match)
+                title = ' '.join(unescape(_TAG_RE.sub(b'', match.group(4)).decode('utf-8', errors='replace')).split())
+                if title and _is_publication_url(full_url):
+                    titles.setdefault(full_url, title)
+        
+        return titles
+    
+    def _link_url(self, match):
+        """Resolve the href captured by a link pattern match to an absolute URL."""
+        value = next(group for group in match.groups()[:3] if group is not None)
+        href = unescape(value.decode('utf-8', errors='replace')).strip()
+        return href if href.startswith('http') else urljoin(self.base_url, href)
+    
+    @staticmethod
+    def _has_publication_headings(html):
+        """Check whether any h1/h2 heading of a page mentions publications."""
+        headings = _HEADING_RE.finditer(_INERT_RE.sub(b'', html))
+        return any(b'publication' in _TAG_RE.sub(b'', match.group(2)).lower() for match in headings)
+    
+    def find_next_page_link(self, tree):
         """
         Find the link to the next page of publications.
         
         Args:
-            soup: BeautifulSoup object of the current page
+            tree: Parsed HTML tree of the current page
             
         Returns:
             URL of the next page or None if not found
         """
-        if not soup:
+        if tree is None:
             return None
             
         # Debug current page content
         self.logger.info(f"Looking for pagination elements on current page")
+        
+        # WordPress archives mark the next page with rel="next" or a "next" class,
+        # which a single selector finds without scanning any pagination links
+        next_link = tree.css_first(_NEXT_LINK_SELECTOR)
+        if next_link:
+            next_url = urljoin(self.base_url, next_link.attributes['href'])
+            self.logger.info(f"Found next page link: {next_url}")
+            return next_url
             
-        # First look specifically for the next page link
-        # Look broadly for any elements that might be pagination controls
-        pagination_wrappers = soup.find_all(['div', 'nav', 'ul'], class_=lambda x: x and any(
-            term in str(x).lower() for term in ['pagination', 'pager', 'nav', 'page-numbers']
-        ))
-        
-        for wrapper in pagination_wrappers:
-            # Within these wrappers, look for links that might be "next page"
-            next_links = wrapper.find_all('a', 
-                string=lambda x: x and any(term in str(x).lower() for term in ['next', 'more', '»', '>', '→']),
-                href=True
-            )
-            
-            if next_links:
-                next_url = urljoin(self.base_url, next_links[0]['href'])
-                self.logger.info(f"Found next page link: {next_url}")
-                return next_url
+        current_page = self._get_current_page_number()
+        next_page = current_page + 1
+        
+        # Look broadly for any elements that might be pagination controls, and scan
+        # each one's links once for both an explicit "next" link and a link to the
+        # next page number; an explicit next link takes precedence
+        for wrapper in tree.css(_PAGINATION_SELECTOR):
+            page_link = None
+            for link in wrapper.css('a[href]:not([href=""])'):
+                href = link.attributes['href']
+                if _NEXT_TEXT_RE.search(link.text()):
+                    next_url = urljoin(self.base_url, href)
+                    self.logger.info(f"Found next page link: {next_url}")
+                    return next_url
                 
-            # If no explicit next link, look for numbered page links
-            page_links = wrapper.find_all('a', href=lambda href: href and ('page' in href or re.search(r'[?&]p=\d+', href)))
+                if page_link is None:
+                    page_match = _PAGE_HREF_RE.search(href)
+                    if page_match and int(page_match.group(1) or page_match.group(2)) == next_page:
+                        page_link = href
             
-            if page_links:
-                current_page = self._get_current_page_number()
-                next_page = current_page + 1
-                
-                # Look for a link to the next page number
-                for link in page_links:
-                    page_match = re.search(r'/page/(\d+)|[?&]p=(\d+)', link['href'])
-                    if page_match:
-                        page_num = int(page_match.group(1) or page_match.group(2))
-                        if page_num == next_page:
-                            next_url = urljoin(self.base_url, link['href'])
-                            self.logger.info(f"Found link to page {next_page}: {next_url}")
-                            return next_url
+            if page_link:
+                next_url = urljoin(self.base_url, page_link)
+                self.logger.info(f"Found link to page {next_page}: {next_url}")
+                return next_url
         
         # If we couldn't find a next link, try to construct one
-        current_page = self._get_current_page_number()
-        next_page = current_page + 1
         
         # Try different URL patterns for next page
         possible_next_urls = [
@@ -213,20 +374,40 @@ class FASPublicationScraper:
         self.logger.info(f"Trying constructed URLs for page {next_page}")
         return possible_next_urls[0]  # Return the first pattern (can be adjusted based on website)
     
+    def _page_url(self, page_num):
+        """Build the URL of an archive page from the standard /page/N/ template."""
+        return f"{self.base_url.rstrip('/')}/page/{page_num}/"
+    
+    def _fetch_pages(self, urls):
+        """
+        Scrape pages concurrently, keeping a bounded number of requests in flight.
+        
+        Args:
+            urls: Iterable of page URLs to fetch
+            
+        Yields:
+            The result of _scrape_page for each page, in the order of urls
+        """
+        urls = iter(urls)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            in_flight = deque(executor.submit(self._scrape_page, url) for url in itertools.islice(urls, self.workers * 2))
+            try:
+                while in_flight:
+                    page = in_flight.popleft().result()
+                    for url in itertools.islice(urls, 1):
+                        in_flight.append(executor.submit(self._scrape_page, url))
+                    yield page
+            finally:
+                # Don't fetch pages queued behind a stop
+                for future in in_flight:
+                    future.cancel()
+    
     def _get_current_page_number(self):
         """Extract the current page number from the base URL or default to 1."""
-        # Try different patterns for page number in URL
-        patterns = [
-            r'/page/(\d+)/?',
-            r'[?&]p=(\d+)',
-            r'[?&]page=(\d+)',
-            r'[?&]paged=(\d+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, self.base_url)
-            if match:
-                return int(match.group(1))
+        # Try the same page number patterns used for pagination links
+        match = _PAGE_HREF_RE.search(self.base_url)
+        if match:
+            return int(match.group(1) or match.group(2))
                 
         return 1  # Default to page 1
     
@@ -248,23 +429,24 @@ class FASPublicationScraper:
         consecutive_empty_pages = 0
         max_empty_pages = 3  # Stop after 3 consecutive pages with no publications
         
+        # Pages fetched ahead of time once the archive is known to use /page/N/ URLs
+        prefetched = None
+        
         while current_url:
             max_page_str = f"/{max_pages}" if max_pages else ""
             self.logger.info(f"Processing page {page_num}{max_page_str}: {current_url}")
-            soup = self.fetch_page(current_url)
+            page = next(prefetched) if prefetched else self._scrape_page(current_url)
             
-            if not soup:
+            if page is None:
                 self.logger.error(f"Failed to fetch page {page_num}{max_page_str}, stopping")
                 break
                 
             # Check if the page seems to be a valid publications page
-            # Look for indicators like titles, section headings, etc.
-            page_titles = soup.find_all(['h1', 'h2'], string=lambda s: s and 'publication' in s.lower())
-            if not page_titles:
+            if not page['has_headings']:
                 self.logger.warning(f"Page {page_num} doesn't appear to have publication headings")
             
-            # Extract publications from this page
-            page_publications = self.extract_publications_from_page(soup)
+            # Publications found on this page
+            page_publications = page['publications']
             
             # Track consecutive empty pages
             if not page_publications:
@@ -277,23 +459,32 @@ class FASPublicationScraper:
             else:
                 consecutive_empty_pages = 0  # Reset counter when we find publications
             
-            # Add these URLs to our master list
-            self.publication_urls.extend(page_publications)
+            # Add the URLs not seen on earlier pages to our master list, keeping the
+            # listing titles so the content scraper has them before it fetches each publication
+            new_publications = [url for url in page_publications if url not in self._seen]
+            self._seen.update(new_publications)
+            self.publication_urls.extend(new_publications)
+            for url, title in page['titles'].items():
+                self.publication_titles.setdefault(url, title)
             
             # Update the CSV file after each page is processed
-            self._append_to_csv(page_publications, page_num)
+            self._append_to_csv(new_publications, page_num)
             
             # Check if we've reached the maximum number of pages
             if max_pages and page_num >= max_pages:
                 self.logger.info(f"Reached maximum number of pages ({page_num}/{max_pages}), stopping")
                 break
                 
-            # Check if there's a next page
-            next_page_url = self.find_next_page_link(soup)
+            # Check if there's a next page; the archive's page URLs follow a fixed
+            # template, so the page's links only need to be searched when probing
+            if prefetched or not self.probe_pagination:
+                next_page_url = self._page_url(page_num + 1)
+            else:
+                next_page_url = page['next_url']
             
             # If we didn't find a next page link, try adding /page/X to the base URL
             if not next_page_url and page_num == 1:
-                next_page_url = f"{self.base_url.rstrip('/')}/page/2/"
+                next_page_url = self._page_url(2)
                 self.logger.info(f"Defaulting to standard page 2 URL: {next_page_url}")
                 
             if next_page_url == current_url:
@@ -304,14 +495,33 @@ class FASPublicationScraper:
                 self.logger.info("No next page found, finished scraping")
                 break
                 
+            # Once the next page follows the /page/N/ template, the URLs of all remaining
+            # pages are known, so fetch them concurrently and process them in page order
+            if not prefetched and max_pages and self.workers > 1 and next_page_url == self._page_url(page_num + 1):
+                self.logger.info(f"Fetching pages {page_num + 1}-{max_pages} with {self.workers} workers")
+                prefetched = self._fetch_pages(self._page_url(n) for n in range(page_num + 1, max_pages + 1))
+                
             current_url = next_page_url
             page_num += 1
         
-        # Remove duplicates while preserving order
-        self.publication_urls = list(dict.fromkeys(self.publication_urls))
+        if prefetched:
+            prefetched.close()
+        
         self.logger.info(f"Scraping complete. Found {len(self.publication_urls)} unique publication URLs")
         return self.publication_urls
     
+    def close(self):
+        """Close the CSV output file and the HTTP cache."""
+        self._csv_file.close()
+        if self.cache:
+            self.cache.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def save_to_file(self, filename='fas_publications.txt'):
         """
         Save the scraped publication URLs to a file.
@@ -328,24 +538,34 @@ class FASPublicationScraper:
 def main():
     parser = argparse.ArgumentParser(description='Scrape publications from the FAS archive')
     parser.add_argument('--min-delay', type=float, default=2.0,
-                        help='Minimum delay between requests in seconds')
+                        help='Delay between requests in seconds')
     parser.add_argument('--max-delay', type=float, default=5.0,
-                        help='Maximum delay between requests in seconds')
+                        help='Maximum delay between requests when the server asks to slow down')
     parser.add_argument('--output', type=str, default='fas_publications.csv',
                         help='Output CSV file name')
     parser.add_argument('--max-pages', type=int, default=53,
                         help='Maximum number of pages to scrape (default: 53)')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Number of archive pages to fetch concurrently')
+    parser.add_argument('--probe-pagination', action='store_true',
+                        help='Follow pagination links found on the page instead of assuming /page/N/ URLs')
+    parser.add_argument('--cache', type=str, default='fas_http_cache.sqlite',
+                        help='HTTP cache database used to avoid re-downloading unchanged pages')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always download pages instead of using the HTTP cache')
     args = parser.parse_args()
     
     # Create the scraper with the output file
-    scraper = FASPublicationScraper(
+    with FASPublicationScraper(
         min_delay=args.min_delay, 
         max_delay=args.max_delay,
-        output_file=args.output
-    )
-    
-    # Scrape publications (CSV file is updated after each page)
-    scraper.scrape_all_publications(max_pages=args.max_pages)
+        output_file=args.output,
+        cache_file=None if args.no_cache else args.cache,
+        workers=args.workers,
+        probe_pagination=args.probe_pagination
+    ) as scraper:
+        # Scrape publications (CSV file is updated after each page)
+        scraper.scrape_all_publications(max_pages=args.max_pages)
     
     # Note: We don't need to save_to_file since we're writing to CSV during scraping
 
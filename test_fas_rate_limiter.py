@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Checks for the request pacing in fas_rate_limiter.py
+
+The clock and sleeps are replaced by a fake clock, so the checks run without real
+waiting. Run with:
+
+    python -m unittest test_fas_rate_limiter
+"""
+
+import threading
+import unittest
+from unittest import mock
+from urllib3.response import HTTPResponse
+from fas_rate_limiter import RateLimiter, RateLimitedRetry
+
+
+class FakeClock:
+    """A monotonic clock that only advances when a caller sleeps."""
+
+    def __init__(self, start=100.0):
+        self.now = start
+        self.slots = {}
+        self._lock = threading.Lock()
+        # Cleared to hold sleepers until the test releases them
+        self.running = threading.Event()
+        self.running.set()
+        self.sleeping = threading.Semaphore(0)
+
+    def monotonic(self):
+        with self._lock:
+            return self.now
+
+    def sleep(self, delay):
+        """Sleep until now + delay, recording that time as the caller's slot."""
+        with self._lock:
+            target = self.now + delay
+            self.slots.setdefault(threading.current_thread().name, []).append(target)
+        self.sleeping.release()
+        self.running.wait()
+        with self._lock:
+            self.now = max(self.now, target)
+
+
+class RateLimiterTest(unittest.TestCase):
+    """Check the spacing, pauses and recovery of RateLimiter."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        for name in ('monotonic', 'sleep'):
+            patcher = mock.patch(f'fas_rate_limiter.time.{name}', getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _slots(self, limiter, count):
+        """Take count successive slots from the limiter and return their times."""
+        slots = []
+        for _ in range(count):
+            limiter.wait()
+            slots.append(self.clock.monotonic())
+        return slots
+
+    def test_slots_are_spaced_by_min_delay(self):
+        limiter = RateLimiter(min_delay=2, max_delay=10)
+        self.assertEqual(self._slots(limiter, 4), [100.0, 102.0, 104.0, 106.0])
+
+    def test_back_off_holds_back_reserved_slots(self):
+        limiter = RateLimiter(min_delay=1, max_delay=10)
+        limiter.wait()
+
+        # Two workers reserve the next slots and sleep until them
+        self.clock.running.clear()
+        workers = [threading.Thread(target=limiter.wait, name=f'worker-{n}') for n in range(2)]
+        for worker in workers:
+            worker.start()
+        for _ in workers:
+            self.assertTrue(self.clock.sleeping.acquire(timeout=5))
+        self.assertEqual(sorted(slots[0] for slots in self.clock.slots.values()), [101.0, 102.0])
+
+        # A 429 response asks for a pause of 5 seconds while they sleep
+        limiter.back_off(retry_after=5)
+        self.clock.running.set()
+        for worker in workers:
+            worker.join(timeout=5)
+            self.assertFalse(worker.is_alive())
+
+        # Both workers went on only after the pause, still spaced apart
+        final_slots = sorted(slots[-1] for slots in self.clock.slots.values())
+        self.assertGreaterEqual(final_slots[0], 105.0)
+        self.assertGreaterEqual(final_slots[1] - final_slots[0], limiter.min_delay)
+
+    def test_interval_decays_back_to_min_delay(self):
+        limiter = RateLimiter(min_delay=1, max_delay=8)
+        limiter.back_off()
+        limiter.back_off()
+        self.assertEqual(limiter.interval, 4)
+
+        slots = self._slots(limiter, 30)
+        gaps = [later - earlier for earlier, later in zip(slots, slots[1:])]
+        self.assertTrue(all(later <= earlier + 1e-9 for earlier, later in zip(gaps, gaps[1:])))
+        self.assertGreater(gaps[0], 1)
+        self.assertAlmostEqual(gaps[-1], 1)
+        self.assertEqual(limiter.interval, 1)
+
+
+class RateLimitedRetryTest(unittest.TestCase):
+    """Check that retries report server pushback to the rate limiter."""
+
+    def test_retry_after_pauses_limiter_before_retry(self):
+        limiter = mock.Mock(spec=RateLimiter)
+        retry = RateLimitedRetry(total=5, status_forcelist=[429], rate_limiter=limiter).new()
+        retry.sleep(HTTPResponse(status=429, headers={'Retry-After': '5'}))
+        self.assertEqual(limiter.mock_calls, [mock.call.back_off(5), mock.call.wait()])
+
+
+if __name__ == '__main__':
+    unittest.main()
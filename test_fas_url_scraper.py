@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Checks for the archive page extraction in fas_url_scraper.py
+
+The byte patterns used to scan archive pages are compared against the Lexbor tree
+extraction they replaced, on markup that trips up naive patterns. Run with:
+
+    python -m unittest test_fas_url_scraper
+"""
+
+import os
+import tempfile
+import unittest
+from urllib.parse import urljoin
+from selectolax.lexbor import LexborHTMLParser
+from fas_url_scraper import FASPublicationScraper, _is_publication_url
+
+SAMPLE_PAGE = b'''<html><head><title>Publications Archive</title></head><body>
+<h1>Publications Archive</h1>
+<h2><a href="https://fas.org/publication/double-quoted/">Double &amp; Quoted</a></h2>
+<h3><a href='/publication/single-quoted/'>Single Quoted</a></h3>
+<h2><A HREF=/publication/unquoted/>Upper <em>Case</em></A></h2>
+<h2 class="entry-title"><span>Report</span> <a class="title" href="/publication/alpha/">Alpha</a></h2>
+<h2><a href="/publication/beta/?utm_source=feed">Beta with query</a></h2>
+<h3><a href="/publications/">Archive index</a></h3>
+<p><a data-href="/publication/not-a-link/" href="/about/">About</a></p>
+<p><a href="https://fas.org/publication/alpha/feed/">Feed</a>
+<a href="https://fas.org/publication/double-quoted/">Read more</a>
+<a href = "  /publication/spaced/  ">Spaced</a></p>
+<header><a href="/publication/in-header/">Header link</a></header>
+<!-- <a href="https://fas.org/publication/commented/">Commented</a> -->
+<script>var t='<a href="https://fas.org/publication/inscript/">'</script>
+<style>a[href="/publication/in-style/"] { color: red }</style>
+<p><a title="a > b" href="https://fas.org/publication/gt/">Greater than</a></p>
+<h2 title="x > y"><a data-note='<' href="/publication/gt-heading/">GT heading</a></h2>
+</body></html>'''
+
+
+def tree_publications(scraper, html):
+    """Extract publication URLs the way the Lexbor tree extractor did."""
+    urls = {}
+    for link in LexborHTMLParser(html).css('a[href]'):
+        href = (link.attributes.get('href') or '').strip()
+        full_url = href if href.startswith('http') else urljoin(scraper.base_url, href)
+        if _is_publication_url(full_url):
+            urls[full_url] = None
+    return list(urls)
+
+
+def tree_titles(scraper, html):
+    """Extract heading titles the way the Lexbor tree extractor did."""
+    titles = {}
+    for link in LexborHTMLParser(html).css('h2 a[href], h3 a[href]'):
+        href = (link.attributes.get('href') or '').strip()
+        full_url = href if href.startswith('http') else urljoin(scraper.base_url, href)
+        title = ' '.join(link.text().split())
+        if title and _is_publication_url(full_url):
+            titles.setdefault(full_url, title)
+    return titles
+
+
+class ExtractionTest(unittest.TestCase):
+    """Compare the byte pattern extraction with the tree extraction."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        output_file = os.path.join(self.tmpdir.name, 'publications.csv')
+        self.scraper = FASPublicationScraper(cache_file=None, output_file=output_file)
+
+    def tearDown(self):
+        self.scraper.close()
+        self.tmpdir.cleanup()
+
+    def test_publications_match_tree(self):
+        urls = self.scraper.extract_publications_from_page(SAMPLE_PAGE)
+        self.assertEqual(urls, tree_publications(self.scraper, SAMPLE_PAGE))
+        self.assertIn('https://fas.org/publication/unquoted/', urls)
+        self.assertIn('https://fas.org/publication/spaced/', urls)
+        self.assertIn('https://fas.org/publication/gt/', urls)
+        self.assertNotIn('https://fas.org/publication/commented/', urls)
+        self.assertNotIn('https://fas.org/publication/inscript/', urls)
+
+    def test_titles_match_tree(self):
+        titles = self.scraper.extract_titles_from_page(SAMPLE_PAGE)
+        self.assertEqual(titles, tree_titles(self.scraper, SAMPLE_PAGE))
+        self.assertEqual(titles['https://fas.org/publication/alpha/'], 'Alpha')
+        self.assertEqual(titles['https://fas.org/publication/unquoted/'], 'Upper Case')
+        self.assertEqual(titles['https://fas.org/publication/gt-heading/'], 'GT heading')
+
+    def test_publication_headings(self):
+        self.assertTrue(FASPublicationScraper._has_publication_headings(SAMPLE_PAGE))
+        self.assertFalse(FASPublicationScraper._has_publication_headings(b'<header>publications</header>'))
+
+
+if __name__ == '__main__':
+    unittest.main()